@@ -1,20 +1,50 @@
 """Google Review Analyzer - Streamlit App"""
 
-import sys, os
+import sys, os, time, threading, importlib
+_START = time.perf_counter()
 sys.path.append('src')
 os.environ['TOKENIZERS_PARALLELISM'] = 'false'
 if 'GOOGLE_API_KEY' not in os.environ:
     raise ValueError("Google API key not found")
 
 import streamlit as st
-from googlemaps import GoogleMapsScraper, clean_reviews
-from sentiment import SentimentAnalyzer
-from llm import GeminiAnalyzer
-from visualizations import *
-from embeddings import EmbeddingGenerator
-from vector_store import ReviewVectorStore
-from rag_pipeline import RAGPipeline
-import pandas as pd
+
+# Heavy modules (selenium, torch/transformers, sentence-transformers, chromadb, langchain,
+# gemini, plotly/seaborn/matplotlib) are imported at first use so the input box renders fast
+HEAVY_MODULES = ['pandas', 'jobs', 'visualizations', 'embeddings', 'vector_store', 'rag_pipeline', 'llm']
+
+@st.cache_resource(show_spinner=False)
+def preload_modules():
+    """Import heavy modules in a background thread while the user types the URL (once per process)"""
+    def _load():
+        start = time.perf_counter()
+        for name in HEAVY_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"Preload of {name} failed: {e}")
+        print(f"Background preload finished in {time.perf_counter() - start:.1f}s")
+    thread = threading.Thread(target=_load, daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_resource(show_spinner=False)
+def startup_report():
+    """Log time to first paint, once per server process (later reruns hit the cache)"""
+    elapsed = time.perf_counter() - _START
+    print(f"Startup: first paint in {elapsed:.2f}s")
+    return elapsed
+
+@st.cache_resource(show_spinner=False)
+def get_job_queue():
+    """One worker pool per server process, shared by all sessions"""
+    from jobs import JobQueue
+    return JobQueue(max_workers=int(os.getenv('ANALYZER_WORKERS', '1')))
+
+@st.cache_resource(show_spinner=False)
+def get_embedder():
+    from embeddings import EmbeddingGenerator
+    return EmbeddingGenerator()
 
 st.set_page_config(page_title="Review Analyzer", page_icon="📊", layout="centered")
 
@@ -43,10 +73,13 @@ def show_sentiment(sentiment_counts):
     col1.metric("😊 Positive", sentiment_counts.get('POSITIVE', 0))
     col2.metric("😞 Negative", sentiment_counts.get('NEGATIVE', 0))
 
-def show_dashboard(df):
+def show_dashboard(df, aspect_df=None):
+    from visualizations import (plot_rating_distribution, plot_sentiment_proportion_by_rating, plot_sentiment_pie,
+                                plot_top_keywords, plot_text_length_distribution, plot_correlation_heatmap,
+                                plot_aspect_sentiment, plot_aspect_net_sentiment)
     st.markdown("---")
     st.markdown("### Data Insights Dashboard")
-    tab1, tab2, tab3 = st.tabs(["📊 Overview", "😊 Sentiment", "📝 Text Analysis"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "😊 Sentiment", "📝 Text Analysis", "🍽️ Aspects"])
     
     with tab1:
         st.plotly_chart(plot_rating_distribution(df), width='stretch')
@@ -70,6 +103,14 @@ def show_dashboard(df):
                 st.plotly_chart(fig, width='stretch')
         with col2:
             st.pyplot(plot_correlation_heatmap(df))
+    
+    with tab4:
+        if fig := plot_aspect_sentiment(aspect_df):
+            st.plotly_chart(fig, width='stretch')
+            st.plotly_chart(plot_aspect_net_sentiment(aspect_df), width='stretch')
+            st.dataframe(aspect_df.round(2), width='stretch')
+        else:
+            st.info("No aspects mentioned in reviews")
 
 def show_insights(insights):
     st.markdown("---")
@@ -81,93 +122,65 @@ def show_insights(insights):
 # Input
 url = st.text_input("Google Maps URL", placeholder="https://www.google.com/maps/place/...")
 num_reviews = st.number_input("Reviews to analyze", min_value=10, max_value=500, value=100)
+startup_report()
+if os.getenv('PRELOAD_MODULES', '1') != '0':
+    preload_modules()
 
 if st.button("Analyze", type="primary"):
     if not url:
         st.error("Please enter a URL")
     else:
         try:
-            # Scraping
-            with st.status("Scraping reviews...", expanded=True) as status:
-                with GoogleMapsScraper(debug=False) as scraper:
-                    print("Scraping reviews...")
-                    error = scraper.sort_by(url, 0)
-                    if error != 0:
-                        st.error("Failed to load reviews. Check URL format.")
-                        st.stop()
-                    
-                    all_reviews = []
-                    n = 0
-                    while n < num_reviews:
-                        reviews = scraper.get_reviews(n)
-                        if len(reviews) == 0:
-                            break
-                        for review in reviews:
-                            st.write(f"**⭐{int(review.get('rating', 0))}/5**: {review.get('caption', 'No text')}")
-                        all_reviews.extend(reviews)
-                        n += len(reviews)
-                    
-                    df = pd.DataFrame(all_reviews)
-                status.update(label=f"Scraped {len(df)} reviews", state="complete")
-            
-            df = clean_reviews(df)
-            show_metrics(df)
-
-            # Processing sentiment
-            with st.spinner("Processing sentiment..."):
-                analyzer = SentimentAnalyzer()
-                df = analyzer.analyze_reviews(df)
-
-            sentiment_counts = df[df['has_text']]['sentiment'].value_counts().to_dict()
-            show_sentiment(sentiment_counts)
-            show_dashboard(df)
-            
-            # Build Vector Store for RAG
-            st.markdown("---")
-            with st.status("Building knowledge base...", expanded=True) as status:
-                st.write("Generating embeddings...")
-                embedder = EmbeddingGenerator()
-                embeddings, text_reviews = embedder.embed_reviews(df)
-                
-                st.write("Storing in vector database...")
-                vector_store = ReviewVectorStore(persist_directory="./chroma_db")
-                vector_store.create_collection("reviews")
-                vector_store.add_reviews(embeddings, text_reviews)
-                
-                st.write("Initializing RAG pipeline...")
-                rag_pipeline = RAGPipeline(vector_store, embedder)
-                
-                stats = vector_store.get_collection_stats()
-                status.update(
-                    label=f"Knowledge base ready ({stats['count']} reviews indexed)", 
-                    state="complete"
-                )
-            
-            # Generate and display insights
-            with st.spinner("Generating AI insights..."):
-                llm = GeminiAnalyzer(rag_pipeline=rag_pipeline)
-                insights = llm.generate_insights(df)
-            
-            show_insights(insights)
-            print("Processing complete!")
-            
-            # Store for chat and reruns (clear old analysis, keep new)
-            st.session_state.clear()
-            st.session_state['df'] = df
-            st.session_state['llm'] = llm
-            st.session_state['sentiment_counts'] = sentiment_counts
-            st.session_state['insights'] = insights
-            st.session_state['messages'] = []  # Initialize empty chat for new analysis
-            
+            # Job id lives in the URL so a browser refresh resumes polling instead of restarting
+            st.query_params['job'] = get_job_queue().submit(url, num_reviews)
         except Exception as e:
             st.error(f"Error: {e}")
             st.stop()
 
-# Redisplay on chat rerun
-elif 'df' in st.session_state:
+job_id = st.query_params.get('job')
+if job_id and st.session_state.get('job_id') != job_id:
+    try:
+        from vector_store import ReviewVectorStore
+        from rag_pipeline import RAGPipeline
+        from llm import GeminiAnalyzer
+        
+        queue = get_job_queue()
+        with st.status("Analyzing reviews...", expanded=True) as status:
+            while (job := queue.status(job_id))['state'] == 'running':
+                status.update(label=job['message'])
+                time.sleep(1)
+            if job['state'] != 'done':
+                del st.query_params['job']
+                status.update(label="Analysis failed", state="error")
+                st.error(f"Error: {job['message']}")
+                st.stop()
+            result = queue.result(job_id)
+            
+            st.write("Initializing RAG pipeline...")
+            vector_store = ReviewVectorStore(persist_directory="./chroma_db")
+            vector_store.get_collection(result['collection'])
+            rag_pipeline = RAGPipeline(vector_store, get_embedder())
+            stats = vector_store.get_collection_stats()
+            status.update(label=f"Analysis complete ({stats['count']} reviews indexed)", state="complete")
+        
+        # Store for chat and reruns (clear old analysis, keep new)
+        st.session_state.clear()
+        st.session_state['job_id'] = job_id
+        st.session_state['df'] = result['df']
+        st.session_state['llm'] = GeminiAnalyzer(rag_pipeline=rag_pipeline)
+        st.session_state['sentiment_counts'] = result['sentiment_counts']
+        st.session_state['aspect_df'] = result['aspect_df']
+        st.session_state['insights'] = result['insights']
+        st.session_state['messages'] = []  # Initialize empty chat for new analysis
+        
+    except Exception as e:
+        st.error(f"Error: {e}")
+        st.stop()
+
+if 'df' in st.session_state:
     show_metrics(st.session_state['df'])
     show_sentiment(st.session_state['sentiment_counts'])
-    show_dashboard(st.session_state['df'])
+    show_dashboard(st.session_state['df'], st.session_state.get('aspect_df'))
     show_insights(st.session_state['insights'])
 
 # Chat interface (always at end)
@@ -188,6 +201,7 @@ if 'df' in st.session_state:
             st.markdown(prompt)
         
         with st.chat_message("assistant"):
+            from llm import GeminiAnalyzer
             llm = st.session_state.get('llm', GeminiAnalyzer())
             print("Answering question using RAG: All reviews searched" if 'llm' in st.session_state else "Fallback mode")
             response = llm.ask_question(prompt, st.session_state['df'])
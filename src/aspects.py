@@ -0,0 +1,121 @@
+"""Aspect-based sentiment using an Aho-Corasick matcher over an aspect lexicon"""
+
+import re
+from bisect import bisect_right
+from collections import deque
+import pandas as pd
+from dedup import representatives
+
+ASPECT_LEXICON = {
+    'food': ['food', 'dish', 'dishes', 'meal', 'taste', 'tasty', 'flavor', 'flavour', 'delicious',
+             'menu', 'portion', 'portions', 'fresh', 'pizza', 'burger', 'pasta', 'dessert', 'coffee'],
+    'service': ['service', 'staff', 'waiter', 'waitress', 'server', 'servers', 'friendly', 'rude',
+                'attentive', 'manager', 'host', 'hospitality'],
+    'price': ['price', 'prices', 'pricey', 'expensive', 'cheap', 'value', 'worth', 'overpriced',
+              'affordable', 'bill', 'cost'],
+    'ambience': ['ambience', 'ambiance', 'atmosphere', 'decor', 'music', 'vibe', 'cozy', 'noisy',
+                 'loud', 'interior', 'seating', 'clean', 'dirty'],
+    'wait time': ['wait', 'waited', 'waiting', 'slow', 'quick', 'fast', 'queue', 'line',
+                  'reservation', 'minutes', 'hour', 'hours', 'delay'],
+}
+
+_SENTENCE = re.compile(r'[^.!?\n]+')
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every lexicon term in a single pass over the text"""
+
+    def __init__(self, patterns):
+        """patterns: iterable of (term, value) pairs; a term may carry several values"""
+        self.goto, self.fail, self.out = [{}], [0], [[]]
+        for term, value in patterns:
+            node = 0
+            for ch in term:
+                if ch not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                    self.goto[node][ch] = len(self.goto) - 1
+                node = self.goto[node][ch]
+            if (len(term), value) not in self.out[node]:
+                self.out[node].append((len(term), value))
+
+        # BFS to build failure links and merge outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[child] = self.goto[f].get(ch, 0)
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, value) for whole-word matches"""
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            for length, value in self.out[node]:
+                start, end = i - length + 1, i + 1
+                if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                    yield start, end, value
+
+
+class AspectExtractor:
+    """Attributes review sentences to aspects and scores them with the sentiment model"""
+
+    def __init__(self, sentiment_analyzer, lexicon=None):
+        self.sentiment_analyzer = sentiment_analyzer
+        self.lexicon = lexicon or ASPECT_LEXICON
+        self.matcher = AhoCorasick((term.lower(), aspect) for aspect, terms in self.lexicon.items() for term in terms)
+
+    def _match_sentences(self, text):
+        """Return {(aspect, sentence)} for one review in a single scan"""
+        text = text.lower()
+        spans = [(m.start(), m.group().strip()) for m in _SENTENCE.finditer(text)]
+        starts = [s for s, _ in spans]
+        matches = set()
+        for start, _, aspect in self.matcher.iter_matches(text):
+            sentence = spans[bisect_right(starts, start) - 1][1]
+            if sentence:
+                matches.add((aspect, sentence))
+        return matches
+
+    def extract(self, df):
+        """Build aspect x sentiment table (mentions, POSITIVE, NEGATIVE, net_sentiment)"""
+        text_reviews = representatives(df)
+        weights = text_reviews['dup_count'] if 'dup_count' in text_reviews else pd.Series(1, index=text_reviews.index)
+
+        mentions = [(aspect, sentence, weight)
+                    for caption, weight in zip(text_reviews['caption'], weights)
+                    for aspect, sentence in self._match_sentences(caption)]
+        if not mentions:
+            return pd.DataFrame(columns=['mentions', 'POSITIVE', 'NEGATIVE', 'net_sentiment'])
+
+        # Score each distinct matched sentence once
+        sentences = list({sentence for _, sentence, _ in mentions})
+        print(f"Scoring {len(sentences)} aspect sentences...")
+        scored = dict(zip(sentences, self.sentiment_analyzer.analyze_batch(sentences)))
+
+        rows = pd.DataFrame([{
+            'aspect': aspect,
+            'label': scored[sentence]['label'],
+            'signed_score': scored[sentence]['score'] * (1 if scored[sentence]['label'] == 'POSITIVE' else -1),
+            'weight': weight
+        } for aspect, sentence, weight in mentions])
+
+        table = rows.pivot_table(index='aspect', columns='label', values='weight', aggfunc='sum', fill_value=0)
+        for col in ['POSITIVE', 'NEGATIVE']:
+            if col not in table.columns:
+                table[col] = 0
+        table = table[['POSITIVE', 'NEGATIVE']]
+        table.insert(0, 'mentions', table.sum(axis=1))
+        rows['weighted'] = rows['signed_score'] * rows['weight']
+        grouped = rows.groupby('aspect')
+        table['net_sentiment'] = grouped['weighted'].sum() / grouped['weight'].sum()
+        table.columns.name = None
+        return table.sort_values('mentions', ascending=False)
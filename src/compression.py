@@ -0,0 +1,126 @@
+"""Dimension reduction (PCA) and scalar quantization for review embeddings
+
+Only PCA is applied to the Chroma index (EMBEDDING_DIM). Float16/int8 quantization is
+evaluation-only: the app never stores compress() codes, they exist so evaluate() can
+report recall@k and bytes per vector for each precision.
+"""
+
+import os
+import numpy as np
+
+
+class EmbeddingCompressor:
+    """Projects embeddings to fewer dimensions; float16/int8 quantization is for evaluation only"""
+
+    PRECISIONS = ('float32', 'float16', 'int8')
+
+    def __init__(self, dim=None, precision='float32'):
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"precision must be one of {self.PRECISIONS}")
+        self.dim = dim
+        self.precision = precision
+        self.mean = None
+        self.components = None
+        self.scale = None
+
+    @classmethod
+    def from_env(cls):
+        """PCA-only compressor for the Chroma index from EMBEDDING_DIM, or None if unset
+
+        Chroma stores float32, so quantized precisions are only used for compress() codes
+        and evaluate(), never on the index path.
+        """
+        dim = os.getenv('EMBEDDING_DIM')
+        return cls(dim=int(dim)) if dim else None
+
+    def fit(self, embeddings):
+        """Learn PCA projection and int8 scales from a sample of embeddings"""
+        X = np.asarray(embeddings, dtype=np.float32)
+        if self.dim and self.dim < X.shape[1] and len(X) <= self.dim:
+            print(f"Only {len(X)} embeddings for PCA to {self.dim} dims, keeping full dimension")
+        elif self.dim and self.dim < X.shape[1]:
+            self.mean = X.mean(axis=0)
+            _, _, vt = np.linalg.svd(X - self.mean, full_matrices=False)
+            self.components = vt[:self.dim].T.copy()
+        projected = self.project(X)
+        self.scale = np.maximum(np.abs(projected).max(axis=0), 1e-8) / 127.0
+        return self
+
+    def project(self, X):
+        """PCA projection in float32 (identity if PCA was skipped)"""
+        X = np.asarray(X, dtype=np.float32)
+        if self.components is None:
+            return X
+        return (X - self.mean) @ self.components
+
+    def compress(self, embeddings):
+        """Return compact codes (float32/float16/int8); not persisted by the app"""
+        projected = self.project(embeddings)
+        if self.precision == 'int8':
+            return np.clip(np.round(projected / self.scale), -127, 127).astype(np.int8)
+        return projected.astype(self.precision)
+
+    def decompress(self, codes):
+        """Codes back to float32 vectors in the reduced space"""
+        if self.precision == 'int8':
+            return codes.astype(np.float32) * self.scale
+        return codes.astype(np.float32)
+
+    def encode(self, embeddings):
+        """Projected and quantization-rounded vectors, as a search over compress() codes would see them"""
+        return self.decompress(self.compress(embeddings))
+
+    def bytes_per_vector(self):
+        dim = self.components.shape[1] if self.components is not None else len(self.scale)
+        return dim * np.dtype(self.precision).itemsize
+
+    def save(self, path):
+        np.savez(path, dim=self.dim or 0, precision=self.precision, scale=self.scale,
+                 mean=self.mean if self.mean is not None else np.empty(0),
+                 components=self.components if self.components is not None else np.empty((0, 0)))
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        compressor = cls(dim=int(data['dim']) or None, precision=str(data['precision']))
+        compressor.scale = data['scale']
+        if data['components'].size:
+            compressor.mean, compressor.components = data['mean'], data['components']
+        return compressor
+
+
+def _top_k(vectors, queries, query_ids, k):
+    """Brute-force cosine top-k, excluding each query's own row"""
+    vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-8)
+    queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-8)
+    sims = queries @ vectors.T
+    sims[np.arange(len(query_ids)), query_ids] = -np.inf
+    return np.argsort(-sims, axis=1)[:, :k]
+
+
+def recall_at_k(embeddings, compressor, k=15, n_queries=100, seed=42):
+    """Fraction of full-precision top-k neighbours that compressed search also returns"""
+    X = np.asarray(embeddings, dtype=np.float32)
+    if len(X) < 2:
+        raise ValueError("recall@k needs at least 2 embeddings")
+    k = min(k, len(X) - 1)
+    query_ids = np.random.default_rng(seed).choice(len(X), size=min(n_queries, len(X)), replace=False)
+    truth = _top_k(X, X[query_ids], query_ids, k)
+    encoded = compressor.encode(X)
+    found = _top_k(encoded, encoded[query_ids], query_ids, k)
+    return float(np.mean([len(set(t) & set(f)) / k for t, f in zip(truth, found)]))
+
+
+def evaluate(embeddings, dims=(None, 192, 128, 64), precisions=EmbeddingCompressor.PRECISIONS, k=15):
+    """Recall@k and storage size for each dim x precision setting"""
+    results = []
+    for dim in dims:
+        for precision in precisions:
+            compressor = EmbeddingCompressor(dim=dim, precision=precision).fit(embeddings)
+            results.append({
+                'dim': compressor.components.shape[1] if compressor.components is not None else np.shape(embeddings)[1],
+                'precision': precision,
+                'bytes_per_vector': compressor.bytes_per_vector(),
+                f'recall@{k}': recall_at_k(embeddings, compressor, k=k),
+            })
+    return results
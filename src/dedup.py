@@ -0,0 +1,86 @@
+"""Near-duplicate review detection using MinHash + LSH"""
+
+import re
+import zlib
+import numpy as np
+
+_PRIME = (1 << 31) - 1
+
+
+class NearDuplicateDetector:
+    """Clusters copy-pasted / templated reviews so they are scored and indexed once"""
+
+    def __init__(self, num_perm=64, bands=16, threshold=0.8, shingle_size=3, seed=42):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, _PRIME, size=num_perm, dtype=np.int64)
+        self.b = rng.integers(0, _PRIME, size=num_perm, dtype=np.int64)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+    def _shingles(self, text):
+        """Hashed word n-grams of normalized text (character n-grams for emoji/punctuation-only text)"""
+        tokens = re.findall(r'\w+', text.lower())
+        if not tokens:
+            tokens = list(text.strip())
+        k = min(self.shingle_size, len(tokens)) or 1
+        grams = {' '.join(tokens[i:i + k]) for i in range(max(len(tokens) - k + 1, 1))}
+        return np.fromiter((zlib.crc32(g.encode()) % _PRIME for g in grams), dtype=np.int64, count=len(grams))
+
+    def signature(self, text):
+        """MinHash signature: per permutation, the minimum hash over all shingles"""
+        hashes = self._shingles(text)
+        return ((np.outer(hashes, self.a) + self.b) % _PRIME).min(axis=0)
+
+    def cluster(self, texts):
+        """Return, for each text, the position of its cluster representative (first member)"""
+        signatures = [self.signature(t) for t in texts]
+        parent = list(range(len(texts)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # LSH banding: only texts sharing a band bucket are compared
+        buckets = {}
+        for i, sig in enumerate(signatures):
+            for band in range(self.bands):
+                key = (band, sig[band * self.rows:(band + 1) * self.rows].tobytes())
+                j = buckets.setdefault(key, i)
+                if j == i:
+                    continue
+                ri, rj = find(i), find(j)
+                if ri != rj and np.mean(signatures[i] == signatures[j]) >= self.threshold:
+                    parent[max(ri, rj)] = min(ri, rj)
+
+        return [find(i) for i in range(len(texts))]
+
+
+def representatives(df):
+    """Reviews with text that stand for their near-duplicate cluster (all text reviews if not deduplicated)"""
+    if 'is_representative' in df:
+        return df[df['has_text'] & df['is_representative']]
+    return df[df['has_text']]
+
+
+def mark_duplicates(df, detector=None):
+    """Add dup_group (index label of representative), dup_count and is_representative columns"""
+    detector = detector or NearDuplicateDetector()
+    df['dup_group'] = df.index
+
+    text_reviews = df[df['has_text']]
+    if len(text_reviews):
+        reps = detector.cluster(text_reviews['caption'].tolist())
+        df.loc[text_reviews.index, 'dup_group'] = text_reviews.index[reps]
+
+    df['dup_count'] = df.groupby('dup_group')['dup_group'].transform('size')
+    df['is_representative'] = df['dup_group'] == df.index
+
+    n_dupes = int((~df['is_representative']).sum())
+    print(f"Near-duplicates: {n_dupes} reviews folded into {int((df['dup_count'] > 1).sum() - n_dupes)} clusters")
+    return df
@@ -2,6 +2,7 @@
 
 from sentence_transformers import SentenceTransformer
 import numpy as np
+from dedup import representatives
 
 
 class EmbeddingGenerator:
@@ -14,7 +15,7 @@ class EmbeddingGenerator:
     def embed_text(self, text):
         """Generate embedding for single text"""
         if not text or not text.strip():
-            return np.zeros(384)
+            return np.zeros(self.model.get_sentence_embedding_dimension(), dtype=np.float32)
         return self.model.encode(text, convert_to_numpy=True)
     
     def embed_batch(self, texts):
@@ -23,8 +24,8 @@ class EmbeddingGenerator:
         return self.model.encode(processed, convert_to_numpy=True, show_progress_bar=True, batch_size=32)
     
     def embed_reviews(self, df):
-        """Generate embeddings for all reviews with text"""
-        text_reviews = df[df['has_text']]
+        """Generate embeddings for all reviews with text (one per near-duplicate cluster)"""
+        text_reviews = representatives(df)
         if len(text_reviews) == 0:
             return np.array([]), text_reviews
         
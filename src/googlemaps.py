@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 import time
 import traceback
+from array import array
+
+import numpy as np
+import pandas as pd
 
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -14,6 +18,46 @@ GM_WEBPAGE = 'https://www.google.com/maps/'
 MAX_WAIT = 10
 MAX_RETRY = 5
 
+class ReviewBatch:
+    """Columnar review container: the scraper appends fields straight into typed columns"""
+
+    __slots__ = ('caption', 'relative_date', 'username', 'rating', 'n_review_user', '_exported')
+
+    def __init__(self):
+        self.caption = []
+        self.relative_date = []
+        self.username = []
+        self.rating = array('d')
+        self.n_review_user = array('q')
+        self._exported = False
+
+    def append(self, caption, relative_date, rating, username, n_review_user):
+        if self._exported:
+            # DataFrames from to_dataframe() pin the numeric buffers, so grow fresh copies instead
+            self.rating = array('d', self.rating)
+            self.n_review_user = array('q', self.n_review_user)
+            self._exported = False
+        self.caption.append(caption)
+        self.relative_date.append(relative_date)
+        self.rating.append(float('nan') if rating is None else rating)
+        self.username.append(username)
+        self.n_review_user.append(n_review_user)
+
+    def __len__(self):
+        return len(self.caption)
+
+    def to_dataframe(self):
+        """Build DataFrame; numeric columns are wrapped without copying"""
+        self._exported = True
+        return pd.DataFrame({
+            'caption': self.caption,
+            'relative_date': self.relative_date,
+            'rating': np.frombuffer(self.rating, dtype=np.float64),
+            'username': self.username,
+            'n_review_user': np.frombuffer(self.n_review_user, dtype=np.int64),
+        }, copy=False)
+
+
 class GoogleMapsScraper:
 
     def __init__(self, debug=False):
@@ -61,8 +105,8 @@ class GoogleMapsScraper:
 
         return 0
 
-    def get_reviews(self, offset):
-        """Scroll to load more reviews and then extract them"""
+    def get_reviews(self, offset, batch=None):
+        """Scroll to load more reviews and append them to batch (new ReviewBatch if None)"""
         self.__scroll()
 
         # wait for other reviews to load (ajax)
@@ -72,18 +116,14 @@ class GoogleMapsScraper:
         # parse reviews
         response = BeautifulSoup(self.driver.page_source, 'html.parser')
         rblock = response.find_all('div', class_='jftiEf fontBodyMedium')
-        parsed_reviews = []
-        for index, review in enumerate(rblock):
-            if index >= offset:
-                r = self.__parse(review)
-                parsed_reviews.append(r)
+        batch = ReviewBatch() if batch is None else batch
+        for review in rblock[offset:]:
+            self.__parse(review, batch)
 
-        return parsed_reviews
-
-    def __parse(self, review):
-        """Extract caption, rating, date, username, and user stats from review element"""
-        item = {}
+        return batch
 
+    def __parse(self, review, batch):
+        """Extract caption, rating, date, username, and user stats from review element into batch"""
         try:
             review_text = review.find('span', class_='wiI7pd').text
             review_text = review_text.replace('\r', ' ').replace('\n', ' ').replace('\t', ' ')
@@ -111,13 +151,7 @@ class GoogleMapsScraper:
         except Exception as e:
             n_review_user = 1
 
-        item['caption'] = review_text
-        item['relative_date'] = relative_date
-        item['rating'] = rating
-        item['username'] = username
-        item['n_review_user'] = n_review_user
-
-        return item
+        batch.append(review_text, relative_date, rating, username, n_review_user)
 
     def __expand_reviews(self):
         """Expand 'More' buttons to show full review text"""
@@ -0,0 +1,199 @@
+"""Background analysis jobs: local queue backed by a worker process pool"""
+
+import multiprocessing as mp
+import threading
+import hashlib
+import re
+import sys
+import types
+import uuid
+from contextlib import contextmanager
+from urllib.parse import unquote, urlsplit
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Per-worker state, populated once by _init_worker
+_worker = {}
+
+
+def place_key(url):
+    """Identify a place independently of map position (@lat,lng,zoom) and query params"""
+    if match := re.search(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)', url, re.IGNORECASE):
+        return match.group(1).lower()
+    path = unquote(urlsplit(url.strip()).path).replace('+', ' ').lower()
+    if match := re.search(r'/place/([^/@]+)', path):
+        return match.group(1).strip()
+    return path.rstrip('/')
+
+
+def collection_name(key, job_id):
+    """Chroma collection name for one run, so a newer run never replaces a collection still in use"""
+    return "reviews_" + hashlib.sha1(key.encode()).hexdigest()[:12] + "_" + job_id[:12]
+
+
+@contextmanager
+def _bare_main():
+    """Hide the script behind __main__ while spawning processes
+
+    Under Streamlit __main__ points at app.py, and spawn children re-run __main__'s file,
+    which would execute the whole app in every worker.
+    """
+    main = sys.modules['__main__']
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        yield
+    finally:
+        sys.modules['__main__'] = main
+
+
+def _init_worker(progress):
+    """Load models once per worker process"""
+    from sentiment import SentimentAnalyzer
+    from embeddings import EmbeddingGenerator
+    _worker['progress'] = progress
+    _worker['analyzer'] = SentimentAnalyzer()
+    _worker['embedder'] = EmbeddingGenerator()
+
+
+def _report(job_id, message):
+    print(message)
+    _worker['progress'][job_id] = message
+
+
+def _run_analysis(job_id, url, num_reviews, persist_directory, collection):
+    """Full pipeline: scrape -> dedup -> sentiment -> aspects -> index -> insights"""
+    from googlemaps import GoogleMapsScraper, ReviewBatch, clean_reviews
+    from dedup import mark_duplicates
+    from aspects import AspectExtractor
+    from vector_store import ReviewVectorStore
+    from compression import EmbeddingCompressor
+    from llm import GeminiAnalyzer
+
+    _report(job_id, "Scraping reviews...")
+    with GoogleMapsScraper(debug=False) as scraper:
+        if scraper.sort_by(url, 0) != 0:
+            raise ValueError("Failed to load reviews. Check URL format.")
+        batch = ReviewBatch()
+        while len(batch) < num_reviews:
+            n = len(batch)
+            scraper.get_reviews(n, batch)
+            if len(batch) == n:
+                break
+            _report(job_id, f"Scraped {len(batch)} reviews...")
+        df = batch.to_dataframe()
+
+    df = mark_duplicates(clean_reviews(df))
+
+    _report(job_id, "Processing sentiment...")
+    analyzer = _worker['analyzer']
+    df = analyzer.analyze_reviews(df)
+    aspect_df = AspectExtractor(analyzer).extract(df)
+
+    _report(job_id, "Building knowledge base...")
+    embeddings, text_reviews = _worker['embedder'].embed_reviews(df)
+    vector_store = ReviewVectorStore(persist_directory=persist_directory, compressor=EmbeddingCompressor.from_env())
+    vector_store.create_collection(collection)
+    vector_store.add_reviews(embeddings, text_reviews)
+
+    _report(job_id, "Generating AI insights...")
+    insights = GeminiAnalyzer().generate_insights(df)
+
+    _report(job_id, "Processing complete!")
+    return {
+        'df': df,
+        'aspect_df': aspect_df,
+        'sentiment_counts': df[df['has_text']]['sentiment'].value_counts().to_dict(),
+        'insights': insights,
+        'collection': collection,
+    }
+
+
+class JobQueue:
+    """Submits analyses to a process pool; jobs for the same place share one run"""
+
+    def __init__(self, max_workers=1, persist_directory="./chroma_db", max_finished=50):
+        self.ctx = mp.get_context('spawn')
+        with _bare_main():
+            self.manager = self.ctx.Manager()
+        self.progress = self.manager.dict()
+        self.max_workers = max_workers
+        self.pool = self._start_pool()
+        self.persist_directory = persist_directory
+        self.max_finished = max_finished
+        self.jobs = {}
+        self.collections = {}
+        self.active = {}
+        self.lock = threading.Lock()
+        print(f"Job queue started with {max_workers} worker(s)")
+
+    def _start_pool(self):
+        # Each worker process runs one job at a time, so max_workers bounds model copies in memory
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.ctx,
+                                   initializer=_init_worker, initargs=(self.progress,))
+
+    def _submit_to_pool(self, fn, *args):
+        """Submit, replacing the pool once if a failed initializer or dead worker broke it"""
+        # Worker processes are spawned lazily on submit
+        with _bare_main():
+            try:
+                return self.pool.submit(fn, *args)
+            except BrokenProcessPool:
+                print("Worker pool broken, restarting")
+                self.pool.shutdown(wait=False, cancel_futures=True)
+                self.pool = self._start_pool()
+                return self.pool.submit(fn, *args)
+
+    def submit(self, url, num_reviews):
+        """Return job id, reusing an in-flight job for this place that asked for at least as many reviews"""
+        key = place_key(url)
+        with self.lock:
+            active = self.active.get(key)
+            if active and active[1] >= num_reviews:
+                return active[0]
+            job_id = uuid.uuid4().hex
+            self.progress[job_id] = "Queued..."
+            collection = collection_name(key, job_id)
+            future = self._submit_to_pool(_run_analysis, job_id, url, num_reviews, self.persist_directory, collection)
+            self.jobs[job_id] = future
+            self.collections[job_id] = collection
+            self.active[key] = (job_id, num_reviews)
+        # Outside the lock: an already-finished future runs the callback immediately in this thread
+        future.add_done_callback(lambda _: self._finish(key, job_id))
+        return job_id
+
+    def _finish(self, key, job_id):
+        with self.lock:
+            if self.active.get(key, (None,))[0] == job_id:
+                del self.active[key]
+            finished = [j for j, f in self.jobs.items() if f.done()]
+            evicted = [self.collections.pop(old) for old in finished[:-self.max_finished]]
+            for old in finished[:-self.max_finished]:
+                del self.jobs[old]
+                self.progress.pop(old, None)
+        if evicted:
+            self._drop_collections(evicted)
+
+    def _drop_collections(self, names):
+        """Delete Chroma collections of evicted jobs"""
+        from vector_store import ReviewVectorStore
+        try:
+            vector_store = ReviewVectorStore(persist_directory=self.persist_directory)
+            for name in names:
+                vector_store.delete_collection(name)
+        except Exception as e:
+            print(f"Failed to drop old collections: {e}")
+
+    def status(self, job_id):
+        """Returns {'state': 'unknown'|'running'|'done'|'failed', 'message': ...}"""
+        future = self.jobs.get(job_id)
+        if future is None:
+            return {'state': 'unknown', 'message': "Job not found"}
+        if not future.done():
+            return {'state': 'running', 'message': self.progress.get(job_id, "Queued...")}
+        if future.exception():
+            return {'state': 'failed', 'message': str(future.exception())}
+        return {'state': 'done', 'message': self.progress.get(job_id, "Done")}
+
+    def result(self, job_id):
+        """Result dict of a finished job (raises if it failed)"""
+        return self.jobs[job_id].result()
@@ -4,6 +4,7 @@ import os
 import time
 from dotenv import load_dotenv
 import google.generativeai as genai
+from dedup import representatives
 
 # Load API key
 load_dotenv()
@@ -34,13 +35,13 @@ class GeminiAnalyzer:
     def generate_insights(self, reviews_df):
         """Generate overall insights from reviews"""
         stats = self._calculate_stats(reviews_df)
-        text_reviews = reviews_df[reviews_df['has_text']]
+        text_reviews = representatives(reviews_df)
         
         # Build prompt
-        reviews_text = "\n".join([
-            f"{row['rating']}★ [{row['sentiment']}]: {row['caption'][:300]}"
-            for _, row in text_reviews.head(15).iterrows()
-        ])
+        sample = text_reviews.head(15)
+        reviews_text = "\n".join(
+            sample['rating'].astype(str) + "★ [" + sample['sentiment'].astype(str) + "]: " + sample['caption'].str[:300]
+        )
         
         prompt = f"""Analyze these reviews briefly:
 
@@ -80,10 +81,8 @@ Keep it crisp and professional. No markdown headers."""
         
         # Fallback: first 15 reviews
         text_reviews = reviews_df[reviews_df['has_text']]
-        reviews_text = "\n".join([
-            f"{row['rating']}⭐: {row['caption'][:300]}" 
-            for _, row in text_reviews.head(15).iterrows()
-        ])
+        sample = text_reviews.head(15)
+        reviews_text = "\n".join(sample['rating'].astype(str) + "⭐: " + sample['caption'].str[:300])
         
         context = f"""You are analyzing restaurant reviews.
 Total: {len(reviews_df)} | Average: {reviews_df['rating'].mean():.1f}/5
@@ -27,7 +27,8 @@ class RAGPipeline:
         """Format retrieved reviews for LLM"""
         docs, metas = search_results['documents'][0], search_results['metadatas'][0]
         return "\n\n".join([
-            f"Review {i+1} [{meta.get('rating', 'N/A')}★, {meta.get('sentiment', 'UNKNOWN')}]: {doc[:300]}"
+            f"Review {i+1} [{meta.get('rating', 'N/A')}★, {meta.get('sentiment', 'UNKNOWN')}"
+            f"{', %d copies' % meta['dup_count'] if meta.get('dup_count', 1) > 1 else ''}]: {doc[:300]}"
             for i, (doc, meta) in enumerate(zip(docs[:max_reviews], metas[:max_reviews]))
         ])
     
@@ -1,6 +1,7 @@
 """Sentiment analysis using DistilBERT"""
 
 from transformers import pipeline
+from dedup import representatives
 
 
 class SentimentAnalyzer:
@@ -16,15 +17,22 @@ class SentimentAnalyzer:
         if not text or len(text.strip()) == 0:
             return {'label': 'NEUTRAL', 'score': 0.0}
         return self.analyzer(text[:512])[0]
-    
+
+    def analyze_batch(self, texts, batch_size=32):
+        """Score a list of texts in batches, returns list of label/score dicts"""
+        if not texts:
+            return []
+        return self.analyzer([t[:512] for t in texts], batch_size=batch_size)
+
     def analyze_reviews(self, df):
         """Add sentiment columns to dataframe"""
         print(f"Analyzing {len(df)} reviews...")
         
-        sentiments = [
-            self.analyze(row['caption']) if row['has_text'] else {'label': 'NEUTRAL', 'score': 0.0}
-            for _, row in df.iterrows()
-        ]
+        # Score one representative per near-duplicate cluster, then fan out to members
+        to_score = representatives(df)
+        scored = {idx: self.analyze(caption) for idx, caption in zip(to_score.index, to_score['caption'])}
+        groups = df['dup_group'] if 'dup_group' in df else df.index
+        sentiments = [scored.get(g, {'label': 'NEUTRAL', 'score': 0.0}) for g in groups]
         
         # Add to dataframe
         df['sentiment'] = [s['label'] for s in sentiments]
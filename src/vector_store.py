@@ -1,14 +1,20 @@
 """ChromaDB vector store for review embeddings"""
 
+import os
 import chromadb
+import numpy as np
+import pandas as pd
 import uuid
+from compression import EmbeddingCompressor
 
 
 class ReviewVectorStore:
     """Manages ChromaDB for storing and querying review embeddings"""
     
-    def __init__(self, persist_directory="./chroma_db"):
-        """Initialize ChromaDB client"""
+    def __init__(self, persist_directory="./chroma_db", compressor=None):
+        """Initialize ChromaDB client (optional EmbeddingCompressor for PCA-reduced storage)"""
+        self.persist_directory = persist_directory
+        self.compressor = compressor
         self.client = chromadb.PersistentClient(
             path=persist_directory,
             settings=chromadb.Settings(anonymized_telemetry=False)
@@ -23,21 +29,52 @@ class ReviewVectorStore:
         except:
             pass
         self.collection = self.client.create_collection(collection_name, metadata={"hnsw:space": "cosine"})
+        if os.path.exists(self._compressor_path()):
+            os.remove(self._compressor_path())
         print(f"Created collection: {collection_name}")
         return self.collection
     
+    def get_collection(self, collection_name="reviews"):
+        """Open an existing collection (e.g. one built by a background worker)"""
+        self.collection = self.client.get_collection(collection_name)
+        if os.path.exists(self._compressor_path()):
+            self.compressor = EmbeddingCompressor.load(self._compressor_path())
+        return self.collection
+    
+    def delete_collection(self, collection_name):
+        """Delete a collection and its saved compressor, if present"""
+        try:
+            self.client.delete_collection(collection_name)
+        except Exception:
+            pass
+        path = self._compressor_path(collection_name)
+        if os.path.exists(path):
+            os.remove(path)
+    
+    def _compressor_path(self, collection_name=None):
+        name = collection_name or self.collection.name
+        return os.path.join(self.persist_directory, f"{name}_compressor.npz")
+    
     def add_reviews(self, embeddings, reviews_df):
         """Add review embeddings with metadata to ChromaDB"""
         if not self.collection:
             raise ValueError("Collection not created. Call create_collection() first.")
         
-        metadatas = [{
-            'rating': float(row['rating']),
-            'sentiment': str(row.get('sentiment', 'UNKNOWN')),
-            'username': str(row['username']),
-            'relative_date': str(row.get('relative_date', '')),
-            'text_length': int(row.get('text_length', 0))
-        } for _, row in reviews_df.iterrows()]
+        metadatas = pd.DataFrame({
+            'rating': reviews_df['rating'].astype(float),
+            'sentiment': reviews_df['sentiment'].astype(str) if 'sentiment' in reviews_df else 'UNKNOWN',
+            'username': reviews_df['username'].astype(str),
+            'relative_date': reviews_df['relative_date'].fillna('').astype(str) if 'relative_date' in reviews_df else '',
+            'text_length': reviews_df['text_length'].astype(int) if 'text_length' in reviews_df else 0,
+            'dup_count': reviews_df['dup_count'].astype(int) if 'dup_count' in reviews_df else 1
+        }, index=reviews_df.index).to_dict('records')
+        
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if self.compressor:
+            if self.compressor.scale is None:
+                self.compressor.fit(embeddings)
+            embeddings = self.compressor.project(embeddings)
+            self.compressor.save(self._compressor_path())
         
         self.collection.add(
             embeddings=embeddings.tolist(),
@@ -60,11 +97,15 @@ class ReviewVectorStore:
                 where['sentiment'] = filters['sentiment']
         
         return self.collection.query(
-            query_embeddings=[query_embedding.tolist()],
+            query_embeddings=self._encode_query(query_embedding),
             n_results=top_k,
             where=where or None
         )
     
+    def _encode_query(self, query_embedding):
+        query = np.asarray(query_embedding, dtype=np.float32)[None, :]
+        return (self.compressor.project(query) if self.compressor else query).tolist()
+    
     def get_collection_stats(self):
         """Get collection statistics"""
         return {"count": self.collection.count() if self.collection else 0}
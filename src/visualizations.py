@@ -129,3 +129,32 @@ def plot_top_keywords(df, sentiment_filter, top_n=10):
     ax.grid(axis='x', alpha=0.3)
     return fig
 
+
+
+def plot_aspect_sentiment(aspect_df):
+    """Stacked bar of positive/negative mentions per aspect"""
+    if aspect_df is None or len(aspect_df) == 0:
+        return None
+    
+    plot_df = aspect_df[['POSITIVE', 'NEGATIVE']].reset_index().melt(
+        id_vars='aspect', var_name='sentiment', value_name='mentions')
+    fig = px.bar(plot_df, x='aspect', y='mentions', color='sentiment',
+                 title='Sentiment by Aspect', barmode='stack',
+                 color_discrete_map=SENTIMENT_COLORS)
+    fig.update_xaxes(title='Aspect')
+    fig.update_yaxes(title='Mentions')
+    return fig
+
+
+def plot_aspect_net_sentiment(aspect_df):
+    """Diverging bar of net sentiment (-1 to 1) per aspect"""
+    if aspect_df is None or len(aspect_df) == 0:
+        return None
+    
+    net = aspect_df['net_sentiment'].sort_values()
+    colors = [SENTIMENT_COLORS['POSITIVE'] if v >= 0 else SENTIMENT_COLORS['NEGATIVE'] for v in net.values]
+    fig = go.Figure(go.Bar(x=net.values, y=net.index, orientation='h', marker_color=colors))
+    fig.update_layout(title='Net Sentiment by Aspect', showlegend=False)
+    fig.update_xaxes(title='Net Sentiment', range=[-1, 1])
+    fig.update_yaxes(title='Aspect')
+    return fig
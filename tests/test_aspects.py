@@ -0,0 +1,67 @@
+import pandas as pd
+
+from aspects import AhoCorasick, AspectExtractor
+from dedup import mark_duplicates
+
+
+class StubAnalyzer:
+    """Negative if the sentence mentions a complaint word, positive otherwise"""
+
+    def __init__(self):
+        self.calls = []
+
+    def analyze_batch(self, texts):
+        self.calls.append(list(texts))
+        return [{'label': 'NEGATIVE' if any(w in t for w in ('slow', 'rude', 'cold')) else 'POSITIVE', 'score': 0.5}
+                for t in texts]
+
+
+def _reviews(captions):
+    df = pd.DataFrame({'caption': captions})
+    df['has_text'] = df['caption'].str.len() > 0
+    return df
+
+
+def test_overlapping_patterns_follow_failure_links():
+    matcher = AhoCorasick([('he', 'HE'), ('she', 'SHE'), ('hers', 'HERS')])
+    assert list(matcher.iter_matches('she hers')) == [(0, 3, 'SHE'), (4, 8, 'HERS')]
+    assert list(matcher.iter_matches('ushers')) == []
+
+
+def test_whole_word_matches_only():
+    matcher = AhoCorasick([('food', 'food')])
+    assert list(matcher.iter_matches('seafood and food')) == [(12, 16, 'food')]
+
+
+def test_term_listed_under_two_aspects_reports_both():
+    extractor = AspectExtractor(StubAnalyzer(), lexicon={'food': ['coffee'], 'price': ['coffee', 'cheap']})
+    assert extractor._match_sentences("Coffee was cheap") == {('food', 'coffee was cheap'), ('price', 'coffee was cheap')}
+
+
+def test_two_aspects_in_one_sentence_and_sentence_attribution():
+    analyzer = StubAnalyzer()
+    table = AspectExtractor(analyzer).extract(_reviews(["The pizza was great. Service was slow!"]))
+    assert table.loc['food', 'POSITIVE'] == 1 and table.loc['food', 'NEGATIVE'] == 0
+    assert table.loc['service', 'NEGATIVE'] == 1 and table.loc['wait time', 'NEGATIVE'] == 1
+    assert sorted(analyzer.calls[0]) == ['service was slow', 'the pizza was great']
+
+
+def test_counts_weighted_by_duplicates():
+    df = mark_duplicates(_reviews([
+        "Friendly staff and a lovely atmosphere every single time we visit",
+        "Friendly staff and a lovely atmosphere every single time we visit!",
+        "Friendly staff and a lovely atmosphere every single time we visit!!",
+        "The coffee was cold",
+    ]))
+    table = AspectExtractor(StubAnalyzer()).extract(df)
+    assert table.loc['service', 'mentions'] == 3
+    assert table.loc['ambience', 'POSITIVE'] == 3
+    assert table.loc['food', 'NEGATIVE'] == 1
+    assert table.index[0] in ('service', 'ambience')
+
+
+def test_no_aspects_returns_empty_table():
+    analyzer = StubAnalyzer()
+    table = AspectExtractor(analyzer).extract(_reviews(["Nice", ""]))
+    assert table.empty and list(table.columns) == ['mentions', 'POSITIVE', 'NEGATIVE', 'net_sentiment']
+    assert analyzer.calls == []
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from compression import EmbeddingCompressor, evaluate, recall_at_k
+
+
+def _embeddings(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.normal(size=(n, 16)) @ rng.normal(size=(16, 384))).astype(np.float32)
+
+
+def test_pca_reduces_dimension():
+    compressor = EmbeddingCompressor(dim=32).fit(_embeddings(200))
+    assert compressor.project(_embeddings(5, seed=1)).shape == (5, 32)
+    assert compressor.bytes_per_vector() == 32 * 4
+
+
+def test_pca_skipped_when_too_few_embeddings():
+    X = _embeddings(1)
+    compressor = EmbeddingCompressor(dim=128).fit(X)
+    assert compressor.components is None
+    np.testing.assert_array_equal(compressor.project(X), X)
+
+
+def test_quantized_codes_and_round_trip(tmp_path):
+    X = _embeddings(200)
+    compressor = EmbeddingCompressor(dim=64, precision='int8').fit(X)
+    assert compressor.compress(X).dtype == np.int8
+
+    compressor.save(tmp_path / "c.npz")
+    loaded = EmbeddingCompressor.load(tmp_path / "c.npz")
+    np.testing.assert_allclose(loaded.encode(X[:5]), compressor.encode(X[:5]))
+
+
+def test_recall_at_k():
+    X = _embeddings(300)
+    assert recall_at_k(X, EmbeddingCompressor().fit(X)) == 1.0
+    assert all(0.0 <= r['recall@15'] <= 1.0 for r in evaluate(X, dims=(None, 32)))
+    with pytest.raises(ValueError):
+        recall_at_k(X[:1], EmbeddingCompressor().fit(X[:1]))
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from dedup import mark_duplicates, representatives
+
+
+def _reviews(captions):
+    df = pd.DataFrame({'caption': captions})
+    df['has_text'] = df['caption'].str.len() > 0
+    return df
+
+
+def test_templated_reviews_share_a_cluster():
+    df = mark_duplicates(_reviews([
+        "Great food and friendly staff, will definitely come back again soon",
+        "Terrible service, waited an hour for cold pasta",
+        "Great food and friendly staff, will definitely come back again soon!!",
+    ]))
+    assert df['dup_group'].tolist() == [0, 1, 0]
+    assert df['dup_count'].tolist() == [2, 1, 2]
+    assert representatives(df).index.tolist() == [0, 1]
+
+
+def test_emoji_and_punctuation_only_reviews_stay_separate():
+    df = mark_duplicates(_reviews(["😍😍😍", "👎👎", "!!!", ""]))
+    assert df['dup_group'].tolist() == [0, 1, 2, 3]
+    assert df['dup_count'].tolist() == [1, 1, 1, 1]
+    assert representatives(df).index.tolist() == [0, 1, 2]
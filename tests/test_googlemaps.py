@@ -0,0 +1,26 @@
+import math
+
+from googlemaps import ReviewBatch
+
+
+def test_review_batch_to_dataframe():
+    batch = ReviewBatch()
+    batch.append("Great food", "2 weeks ago", 5.0, "alice", 12)
+    batch.append(None, None, None, "Anonymous", 1)
+
+    df = batch.to_dataframe()
+    assert len(batch) == 2
+    assert df['caption'].tolist()[0] == "Great food"
+    assert df['rating'].iloc[0] == 5.0 and math.isnan(df['rating'].iloc[1])
+    assert df['n_review_user'].tolist() == [12, 1]
+
+
+def test_review_batch_append_after_export_keeps_dataframe_intact():
+    batch = ReviewBatch()
+    batch.append("First", "1 day ago", 4.0, "bob", 3)
+    df = batch.to_dataframe()
+
+    batch.append("Second", "2 days ago", 2.0, "carol", 7)
+    assert len(batch) == 2
+    assert df['rating'].tolist() == [4.0]
+    assert batch.to_dataframe()['rating'].tolist() == [4.0, 2.0]
@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('streamlit')
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Seconds allowed from interpreter start to the URL input box (streamlit itself included)
+IMPORT_BUDGET_S = 5.0
+
+FORBIDDEN_AT_FIRST_PAINT = ['torch', 'transformers', 'sentence_transformers', 'chromadb', 'langchain',
+                 'langchain_google_genai', 'google.generativeai', 'plotly', 'seaborn', 'matplotlib',
+                 'selenium', 'bs4']
+
+# Runs app.py the way a fresh server process would, up to first paint
+FIRST_PAINT = f"""
+import json, runpy, sys, time
+start = time.perf_counter()
+runpy.run_path('app.py', run_name='__main__')
+print(json.dumps({{
+    'elapsed': time.perf_counter() - start,
+    'heavy': [m for m in {FORBIDDEN_AT_FIRST_PAINT!r} if m in sys.modules],
+}}))
+"""
+
+
+def _first_paint():
+    env = {**os.environ, 'GOOGLE_API_KEY': os.environ.get('GOOGLE_API_KEY', 'test'), 'PRELOAD_MODULES': '0'}
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', FIRST_PAINT], cwd=ROOT, env=env,
+                          capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    imports = []
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if line.startswith('import time:') and parts[1].strip().isdigit():
+            imports.append((int(parts[1]), parts[2][1:]))
+    # nested imports are indented under their parent
+    top_level = sorted((i for i in imports if not i[1].startswith(' ')), reverse=True)[:10]
+    report = "\n".join(f"{us / 1e6:8.3f}s  {name}" for us, name in top_level)
+    print(f"\nSlowest top-level imports before first paint:\n{report}")
+
+    return json.loads(proc.stdout.strip().splitlines()[-1]), report
+
+
+def test_first_paint_skips_heavy_imports_and_meets_budget():
+    result, report = _first_paint()
+    assert result['heavy'] == [], f"heavy modules imported before first paint: {result['heavy']}"
+    assert result['elapsed'] < IMPORT_BUDGET_S, f"first paint took {result['elapsed']:.2f}s\n{report}"
@@ -0,0 +1,45 @@
+import os
+import sys
+import types
+from concurrent.futures import wait
+
+from jobs import JobQueue, collection_name, place_key
+
+PLACE_ID = "!1s0x89c259a61c75684f:0x79d31adb123348d2"
+
+
+def test_place_key_ignores_viewport_and_query():
+    a = f"https://www.google.com/maps/place/Joe's+Pizza/@40.73,-73.99,17z/data=!4m8!3m7{PLACE_ID}!8m2?hl=en"
+    b = f"https://www.google.com/maps/place/Joe's+Pizza/@40.74,-73.98,15z/data=!3m1!4b1!4m6{PLACE_ID}?entry=ttu"
+    assert place_key(a) == place_key(b) == "0x89c259a61c75684f:0x79d31adb123348d2"
+
+
+def test_place_key_falls_back_to_place_name():
+    a = "https://www.google.com/maps/place/Joe's+Pizza/@40.73,-73.99,17z?hl=en"
+    b = "https://www.google.com/maps/place/Joe%27s%20Pizza/@40.74,-73.98,15z/"
+    assert place_key(a) == place_key(b) == "joe's pizza"
+
+
+def test_collection_name_is_unique_per_run():
+    assert collection_name("joe's pizza", "a" * 32) != collection_name("joe's pizza", "b" * 32)
+    assert collection_name("joe's pizza", "a" * 32) == collection_name("joe's pizza", "a" * 32)
+
+
+def test_spawned_processes_do_not_rerun_the_app_script(tmp_path, monkeypatch):
+    # Streamlit swaps in a __main__ whose __file__ is app.py; spawn children would re-run it
+    marker = tmp_path / "ran"
+    script = tmp_path / "app.py"
+    script.write_text(f"open({str(marker)!r}, 'w').close()\n")
+    fake_main = types.ModuleType('__main__')
+    fake_main.__file__ = str(script)
+    monkeypatch.setitem(sys.modules, '__main__', fake_main)
+
+    queue = JobQueue(persist_directory=str(tmp_path / "chroma"))
+    try:
+        future = queue._submit_to_pool(os.getpid)
+        wait([future], timeout=120)
+        assert sys.modules['__main__'] is fake_main
+        assert not marker.exists()
+    finally:
+        queue.pool.shutdown(cancel_futures=True)
+        queue.manager.shutdown()